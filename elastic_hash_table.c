@@ -37,6 +37,7 @@ struct ElasticHashTable {
     size_t    min_level_size;
     double    max_load;
     double    tombstone_ratio;
+    uint64_t  version;            /* bumped on every rebuild              */
     SubArray* levels;
 };
 
@@ -326,6 +327,30 @@ static int rebuild(ElasticHashTable* t, size_t new_capacity)
     free(keys);
     free(vals);
     free(lens);
+    t->version++;
+    return 0;
+}
+
+/* ------------------------------------------------------------------ */
+/* Public: reserve / tuning                                           */
+/* ------------------------------------------------------------------ */
+
+int eht_reserve(ElasticHashTable* t, size_t n_entries)
+{
+    size_t target = t->total_capacity;
+    while ((size_t)(target * t->max_load) < n_entries) {
+        if (target > SIZE_MAX / 2) return -1;  /* would wrap to 0 and spin */
+        target *= 2;
+    }
+    if (target == t->total_capacity) return 0;
+    if (rebuild(t, target) < 0) return -1;
+    return 1;
+}
+
+int eht_set_max_load(ElasticHashTable* t, double max_load)
+{
+    if (max_load <= 0.0 || max_load >= 1.0) return -1;
+    t->max_load = max_load;
     return 0;
 }
 
@@ -337,6 +362,8 @@ int eht_insert(ElasticHashTable* t,
                const char* key,
                const void* value, size_t value_len)
 {
+    uint64_t v0 = t->version;
+
     /* Update-in-place if already present */
     FindResult fr = find_key(t, key);
     if (fr.level_idx >= 0) {
@@ -373,7 +400,8 @@ int eht_insert(ElasticHashTable* t,
     memcpy(kdup, key, klen);
     memcpy(vdup, value, value_len);
 
-    return insert_owned(t, kdup, vdup, value_len);
+    if (insert_owned(t, kdup, vdup, value_len) < 0) return -1;
+    return t->version != v0 ? 1 : 0;
 }
 
 /* ------------------------------------------------------------------ */
@@ -421,6 +449,41 @@ int eht_contains(ElasticHashTable* t, const char* key)
     return find_key(t, key).level_idx >= 0 ? 1 : 0;
 }
 
+/* ------------------------------------------------------------------ */
+/* Public: batched operations                                         */
+/* ------------------------------------------------------------------ */
+
+int eht_bulk_insert(ElasticHashTable* t, size_t n,
+                    const char* const* keys,
+                    const void* const* values,
+                    const size_t* value_lens)
+{
+    int resized = 0;
+    for (size_t i = 0; i < n; ++i) {
+        int rc = eht_insert(t, keys[i], values[i], value_lens[i]);
+        if (rc < 0) return -1;
+        if (rc > 0) resized = 1;
+    }
+    return resized;
+}
+
+size_t eht_bulk_get(ElasticHashTable* t, size_t n,
+                    const char* const* keys,
+                    const void** values_out,
+                    size_t* lens_out)
+{
+    size_t found = 0;
+    for (size_t i = 0; i < n; ++i) {
+        if (eht_get(t, keys[i], &values_out[i], &lens_out[i])) {
+            ++found;
+        } else {
+            values_out[i] = NULL;
+            lens_out[i]   = 0;
+        }
+    }
+    return found;
+}
+
 /* ------------------------------------------------------------------ */
 /* Public: metadata                                                   */
 /* ------------------------------------------------------------------ */
@@ -441,10 +504,46 @@ void eht_level_stats(const ElasticHashTable* t,
     }
 }
 
+void eht_level_arrays(const ElasticHashTable* t,
+                      size_t* caps_out, size_t* counts_out,
+                      size_t* tombstones_out, size_t max_levels)
+{
+    size_t n = t->num_levels < max_levels ? t->num_levels : max_levels;
+    for (size_t i = 0; i < n; ++i) {
+        caps_out[i]       = t->levels[i].capacity;
+        counts_out[i]     = t->levels[i].count;
+        tombstones_out[i] = t->levels[i].tombstones;
+    }
+}
+
 /* ------------------------------------------------------------------ */
 /* Public: iteration                                                  */
 /* ------------------------------------------------------------------ */
 
+size_t eht_snapshot(ElasticHashTable* t,
+                    const char** keys_out,
+                    size_t* key_lens_out,
+                    const void** values_out,
+                    size_t* lens_out,
+                    size_t max_entries)
+{
+    size_t n = 0;
+    for (size_t li = 0; li < t->num_levels && n < max_entries; ++li) {
+        SubArray* sub = &t->levels[li];
+        for (size_t si = 0; si < sub->capacity && n < max_entries; ++si) {
+            Slot* s = &sub->slots[si];
+            if (s->state == SLOT_OCCUPIED) {
+                keys_out[n]     = s->key;
+                key_lens_out[n] = strlen(s->key);
+                values_out[n]   = s->value;
+                lens_out[n]     = s->value_len;
+                ++n;
+            }
+        }
+    }
+    return n;
+}
+
 EHTIterator* eht_iter_create(ElasticHashTable* t)
 {
     EHTIterator* it = (EHTIterator*)calloc(1, sizeof(*it));
@@ -457,6 +556,7 @@ EHTIterator* eht_iter_create(ElasticHashTable* t)
 
 int eht_iter_next(EHTIterator* it,
                   const char** key_out,
+                  size_t* key_len_out,
                   const void** value_out,
                   size_t* len_out)
 {
@@ -467,9 +567,10 @@ int eht_iter_next(EHTIterator* it,
             Slot* s = &sub->slots[it->slot_idx];
             it->slot_idx++;
             if (s->state == SLOT_OCCUPIED) {
-                *key_out   = s->key;
-                *value_out = s->value;
-                *len_out   = s->value_len;
+                *key_out     = s->key;
+                *key_len_out = strlen(s->key);
+                *value_out   = s->value;
+                *len_out     = s->value_len;
                 return 1;
             }
         }
@@ -39,9 +39,21 @@ typedef struct EHTIterator EHTIterator;
 ElasticHashTable* eht_create(size_t total_capacity);
 void              eht_destroy(ElasticHashTable* t);
 
+/*  Ensures capacity for at least n_entries live entries without further
+ *  rehashing (doubling the address space as needed in one rebuild).
+ *  Returns 0 if no rebuild was needed, 1 if the table was rebuilt,
+ *  -1 on allocation failure or if n_entries is too large to size for. */
+int  eht_reserve(ElasticHashTable* t, size_t n_entries);
+
+/*  Sets the load-factor threshold that triggers a doubling rebuild.
+ *  Returns 0 on success, -1 if max_load is outside (0, 1). */
+int  eht_set_max_load(ElasticHashTable* t, double max_load);
+
 /* ---------- Core operations ---------- */
 
-/*  Returns 0 on success, -1 on allocation failure. */
+/*  Returns 0 on success, 1 on success where the call triggered a
+ *  rebuild (capacity and level layout changed), -1 on allocation
+ *  failure. */
 int  eht_insert(ElasticHashTable* t,
                 const char* key,
                 const void* value, size_t value_len);
@@ -59,6 +71,25 @@ int  eht_delete(ElasticHashTable* t, const char* key);
 /*  Returns 1 if key is present, 0 otherwise. */
 int  eht_contains(ElasticHashTable* t, const char* key);
 
+/* ---------- Batched operations ---------- */
+
+/*  Inserts n entries in one call, amortising FFI overhead across the
+ *  batch.  Returns 0 on success, 1 on success where any insert triggered
+ *  a rebuild, -1 on allocation failure (entries before the failing one
+ *  remain inserted). */
+int  eht_bulk_insert(ElasticHashTable* t, size_t n,
+                     const char* const* keys,
+                     const void* const* values,
+                     const size_t* value_lens);
+
+/*  Looks up n keys in one call.  For each key i, sets values_out[i] and
+ *  lens_out[i] on a hit, or NULL / 0 on a miss.  Returns the number of
+ *  keys found.  Pointer lifetime rules are the same as eht_get. */
+size_t eht_bulk_get(ElasticHashTable* t, size_t n,
+                    const char* const* keys,
+                    const void** values_out,
+                    size_t* lens_out);
+
 /* ---------- Metadata ---------- */
 
 size_t eht_len(const ElasticHashTable* t);
@@ -67,13 +98,33 @@ size_t eht_num_levels(const ElasticHashTable* t);
 void   eht_level_stats(const ElasticHashTable* t,
                         EHTLevelInfo* out, size_t max_levels);
 
+/*  Structure-of-arrays variant of eht_level_stats: fills three parallel
+ *  size_t arrays (capacity, live count, tombstones per level) in one
+ *  call, so language bindings can wrap them without per-struct field
+ *  marshalling. */
+void   eht_level_arrays(const ElasticHashTable* t,
+                         size_t* caps_out, size_t* counts_out,
+                         size_t* tombstones_out, size_t max_levels);
+
 /* ---------- Iteration ---------- */
 
+/*  Fills the out arrays with pointers to up to max_entries live entries
+ *  in a single pass — one call instead of one eht_iter_next round-trip
+ *  per element.  Returns the number of entries written.  Pointer
+ *  lifetime rules are the same as eht_get. */
+size_t eht_snapshot(ElasticHashTable* t,
+                    const char** keys_out,
+                    size_t* key_lens_out,
+                    const void** values_out,
+                    size_t* lens_out,
+                    size_t max_entries);
+
 EHTIterator* eht_iter_create(ElasticHashTable* t);
 /*  Advances the iterator.  Returns 1 and populates the out-params if
  *  there is a next entry, 0 at end-of-table. */
 int          eht_iter_next(EHTIterator* it,
                            const char** key_out,
+                           size_t* key_len_out,
                            const void** value_out,
                            size_t* len_out);
 void         eht_iter_destroy(EHTIterator* it);
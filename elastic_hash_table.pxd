@@ -0,0 +1,71 @@
+# cython: language_level=3
+#
+# Cython declarations for the Elastic Hash Table C API.
+#
+# These mirror elastic_hash_table.h one-to-one so that a future compiled
+# wrapper (a `cdef class` calling these functions directly, skipping the
+# ctypes marshalling layer) can be written against them without
+# re-transcribing the header.  Nothing in the repo builds such a wrapper
+# yet; the shipped binding is the pure-Python ctypes module, and these
+# declarations are kept in sync with the header as the C ABI evolves.
+
+from libc.stddef cimport size_t
+
+
+cdef extern from "elastic_hash_table.h":
+    ctypedef struct ElasticHashTable:
+        pass
+
+    ctypedef struct EHTLevelInfo:
+        int    level
+        size_t capacity
+        size_t count
+        size_t tombstones
+
+    ctypedef struct EHTIterator:
+        pass
+
+    # -- Lifecycle --
+    ElasticHashTable* eht_create(size_t total_capacity)
+    void              eht_destroy(ElasticHashTable* t)
+
+    int  eht_reserve(ElasticHashTable* t, size_t n_entries)
+    int  eht_set_max_load(ElasticHashTable* t, double max_load)
+
+    # -- Core ops --
+    int  eht_insert(ElasticHashTable* t, const char* key,
+                    const void* value, size_t value_len)
+    int  eht_get(ElasticHashTable* t, const char* key,
+                 const void** value_out, size_t* len_out)
+    int  eht_delete(ElasticHashTable* t, const char* key)
+    int  eht_contains(ElasticHashTable* t, const char* key)
+
+    # -- Batched ops --
+    int    eht_bulk_insert(ElasticHashTable* t, size_t n,
+                           const char* const* keys,
+                           const void* const* values,
+                           const size_t* value_lens)
+    size_t eht_bulk_get(ElasticHashTable* t, size_t n,
+                        const char* const* keys,
+                        const void** values_out, size_t* lens_out)
+
+    # -- Metadata --
+    size_t eht_len(const ElasticHashTable* t)
+    size_t eht_capacity(const ElasticHashTable* t)
+    size_t eht_num_levels(const ElasticHashTable* t)
+    void   eht_level_stats(const ElasticHashTable* t,
+                           EHTLevelInfo* out, size_t max_levels)
+    void   eht_level_arrays(const ElasticHashTable* t,
+                            size_t* caps_out, size_t* counts_out,
+                            size_t* tombstones_out, size_t max_levels)
+
+    # -- Iteration --
+    size_t eht_snapshot(ElasticHashTable* t, const char** keys_out,
+                        size_t* key_lens_out,
+                        const void** values_out, size_t* lens_out,
+                        size_t max_entries)
+    EHTIterator* eht_iter_create(ElasticHashTable* t)
+    int          eht_iter_next(EHTIterator* it, const char** key_out,
+                               size_t* key_len_out,
+                               const void** value_out, size_t* len_out)
+    void         eht_iter_destroy(EHTIterator* it)
@@ -19,14 +19,20 @@ from __future__ import annotations
 
 import ctypes
 import ctypes.util
-import os
 import pickle
 import platform
 import struct
 import sys
+import threading
+import weakref
 from pathlib import Path
 from typing import Any, Iterator, Optional, Tuple
 
+try:
+    import numpy as _np
+except ImportError:        # numpy is optional — only used for zero-copy stats
+    _np = None
+
 
 # -------------------------------------------------------------------
 # Locate and load the shared library
@@ -71,75 +77,197 @@ class _EHTLevelInfo(ctypes.Structure):
     ]
 
 
-# -- Lifecycle --
-_lib.eht_create.argtypes  = [ctypes.c_size_t]
-_lib.eht_create.restype   = ctypes.c_void_p
+# Every C entry point is bound through an explicit CFUNCTYPE prototype
+# rather than per-function argtypes assignments: each prototype is a
+# precompiled dispatch shim that ctypes reuses on every call (cheaper on
+# 3.11+), the bound names skip the `_lib.eht_*` attribute lookups on hot
+# paths, and each prototype maps 1:1 onto a `cdef extern` declaration in
+# elastic_hash_table.pxd, keeping the two views of the C ABI in sync.
 
-_lib.eht_destroy.argtypes = [ctypes.c_void_p]
-_lib.eht_destroy.restype  = None
+_INT     = ctypes.c_int
+_SIZE    = ctypes.c_size_t
+_DOUBLE  = ctypes.c_double
+_HANDLE  = ctypes.c_void_p
+_CHARP   = ctypes.c_char_p
+_VOIDP   = ctypes.c_void_p
+_SIZE_P  = ctypes.POINTER(ctypes.c_size_t)
+_VOIDP_P = ctypes.POINTER(ctypes.c_void_p)
+_CHARP_P = ctypes.POINTER(ctypes.c_char_p)
 
-# -- Core ops --
-_lib.eht_insert.argtypes  = [ctypes.c_void_p, ctypes.c_char_p,
-                              ctypes.c_void_p, ctypes.c_size_t]
-_lib.eht_insert.restype   = ctypes.c_int
 
-_lib.eht_get.argtypes     = [ctypes.c_void_p, ctypes.c_char_p,
-                              ctypes.POINTER(ctypes.c_void_p),
-                              ctypes.POINTER(ctypes.c_size_t)]
-_lib.eht_get.restype      = ctypes.c_int
+def _proto(name: str, restype, *argtypes):
+    return ctypes.CFUNCTYPE(restype, *argtypes)((name, _lib))
 
-_lib.eht_delete.argtypes  = [ctypes.c_void_p, ctypes.c_char_p]
-_lib.eht_delete.restype   = ctypes.c_int
 
-_lib.eht_contains.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
-_lib.eht_contains.restype  = ctypes.c_int
-
-# -- Metadata --
-_lib.eht_len.argtypes        = [ctypes.c_void_p]
-_lib.eht_len.restype         = ctypes.c_size_t
+# -- Lifecycle --
+_eht_create       = _proto("eht_create", _HANDLE, _SIZE)
+_eht_destroy      = _proto("eht_destroy", None, _HANDLE)
+_eht_reserve      = _proto("eht_reserve", _INT, _HANDLE, _SIZE)
+_eht_set_max_load = _proto("eht_set_max_load", _INT, _HANDLE, _DOUBLE)
 
-_lib.eht_capacity.argtypes   = [ctypes.c_void_p]
-_lib.eht_capacity.restype    = ctypes.c_size_t
+# -- Core ops --
+_eht_insert   = _proto("eht_insert", _INT, _HANDLE, _CHARP, _VOIDP, _SIZE)
+_eht_get      = _proto("eht_get", _INT, _HANDLE, _CHARP, _VOIDP_P, _SIZE_P)
+_eht_delete   = _proto("eht_delete", _INT, _HANDLE, _CHARP)
+_eht_contains = _proto("eht_contains", _INT, _HANDLE, _CHARP)
 
-_lib.eht_num_levels.argtypes = [ctypes.c_void_p]
-_lib.eht_num_levels.restype  = ctypes.c_size_t
+# -- Batched ops --
+_eht_bulk_insert = _proto("eht_bulk_insert", _INT, _HANDLE, _SIZE,
+                          _CHARP_P, _CHARP_P, _SIZE_P)
+_eht_bulk_get    = _proto("eht_bulk_get", _SIZE, _HANDLE, _SIZE,
+                          _CHARP_P, _VOIDP_P, _SIZE_P)
 
-_lib.eht_level_stats.argtypes = [ctypes.c_void_p,
-                                  ctypes.POINTER(_EHTLevelInfo),
-                                  ctypes.c_size_t]
-_lib.eht_level_stats.restype  = None
+# -- Metadata --
+_eht_len          = _proto("eht_len", _SIZE, _HANDLE)
+_eht_capacity     = _proto("eht_capacity", _SIZE, _HANDLE)
+_eht_num_levels   = _proto("eht_num_levels", _SIZE, _HANDLE)
+_eht_level_stats  = _proto("eht_level_stats", None, _HANDLE,
+                           ctypes.POINTER(_EHTLevelInfo), _SIZE)
+_eht_level_arrays = _proto("eht_level_arrays", None, _HANDLE,
+                           _SIZE_P, _SIZE_P, _SIZE_P, _SIZE)
 
 # -- Iteration --
-_lib.eht_iter_create.argtypes  = [ctypes.c_void_p]
-_lib.eht_iter_create.restype   = ctypes.c_void_p
+_eht_snapshot     = _proto("eht_snapshot", _SIZE, _HANDLE, _VOIDP_P,
+                           _SIZE_P, _VOIDP_P, _SIZE_P, _SIZE)
+_eht_iter_create  = _proto("eht_iter_create", _HANDLE, _HANDLE)
+_eht_iter_next    = _proto("eht_iter_next", _INT, _HANDLE, _VOIDP_P,
+                           _SIZE_P, _VOIDP_P, _SIZE_P)
+_eht_iter_destroy = _proto("eht_iter_destroy", None, _HANDLE)
 
-_lib.eht_iter_next.argtypes    = [ctypes.c_void_p,
-                                   ctypes.POINTER(ctypes.c_char_p),
-                                   ctypes.POINTER(ctypes.c_void_p),
-                                   ctypes.POINTER(ctypes.c_size_t)]
-_lib.eht_iter_next.restype     = ctypes.c_int
-
-_lib.eht_iter_destroy.argtypes = [ctypes.c_void_p]
-_lib.eht_iter_destroy.restype  = None
+# byref / string_at, bound once for the same reason.
+_byref     = ctypes.byref
+_string_at = ctypes.string_at
 
 
 # -------------------------------------------------------------------
 # Serialisation helpers
 # -------------------------------------------------------------------
 
-def _key_to_bytes(key: Any) -> bytes:
+# Bounded encode cache for str keys.  Mixed read/write workloads touch
+# the same keys many times, and a dict hit on an (often interned) str is
+# much cheaper than re-running str.encode.  Individual dict operations
+# are atomic under the GIL, so no locking is needed.
+_KEY_CACHE_MAX = 1024
+_key_cache: dict = {}
+
+
+def _enc_str(key: str) -> bytes:
+    kb = _key_cache.get(key)
+    if kb is None:
+        kb = key.encode("utf-8")
+        if len(_key_cache) < _KEY_CACHE_MAX:
+            _key_cache[key] = kb
+    return kb
+
+
+# Dispatch-by-exact-type: a single dict lookup replaces the isinstance
+# branch chain for the overwhelmingly common key types.
+_KEY_ENCODERS = {
+    str:   _enc_str,
+    bytes: lambda k: k,
+    int:   lambda k: str(k).encode(),
+}
+
+
+def _key_to_bytes(key: Any, _enc=_KEY_ENCODERS.get) -> bytes:
     """Convert an arbitrary Python key to a UTF-8 C string."""
-    if isinstance(key, bytes):
+    fn = _enc(type(key))
+    if fn is not None:
+        return fn(key)
+    if isinstance(key, bytes):       # bytes subclass
         return key
     return str(key).encode("utf-8")
 
 
-def _ser_value(value: Any) -> bytes:
-    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+# Value wire format: a 1-byte type tag followed by the payload.  Common
+# scalars are stored raw, skipping pickle's protocol overhead entirely
+# (5-10x cheaper for small values); tag 0x00 falls back to a full pickle
+# stream so arbitrary objects keep working.
+#
+#   0x00  pickle stream          0x04  True   (no payload)
+#   0x01  int, 8-byte LE signed  0x05  False  (no payload)
+#   0x02  float, IEEE-754 LE     0x06  str, UTF-8
+#   0x03  None  (no payload)     0x07  pickle-5 + out-of-band buffers
+#
+# Tag 0x07 frames a protocol-5 stream whose PickleBuffer payloads were
+# handed out via buffer_callback:  u64 LE pickle length, the pickle
+# stream, then each buffer as u64 LE length + raw bytes.  Keeping large
+# buffers out of the pickle stream avoids pickling them opcode-by-opcode.
+
+# pickle.dumps / pickle.loads are C functions from _pickle; bind them
+# once so serialisation call sites skip the module-attribute lookup.
+_dumps = pickle.dumps
+_loads = pickle.loads
+
+_pack_double   = struct.Struct("<d").pack
+_unpack_double = struct.Struct("<d").unpack_from
+_pack_u64      = struct.Struct("<Q").pack
+_unpack_u64    = struct.Struct("<Q").unpack_from
+
+
+def _ser_value(value: Any,
+               protocol: int = pickle.HIGHEST_PROTOCOL) -> bytes:
+    t = type(value)
+    if t is int:
+        try:
+            return b"\x01" + value.to_bytes(8, "little", signed=True)
+        except OverflowError:
+            pass  # big ints fall through to pickle
+    elif t is float:
+        return b"\x02" + _pack_double(value)
+    elif t is str:
+        try:
+            return b"\x06" + value.encode("utf-8")
+        except UnicodeEncodeError:
+            pass  # lone surrogates fall through to pickle
+    elif t is bool:
+        return b"\x04" if value else b"\x05"
+    elif value is None:
+        return b"\x03"
+    if protocol >= 5:
+        oob: list = []
+        data = _dumps(value, protocol, buffer_callback=oob.append)
+        if oob:
+            parts = [b"\x07", _pack_u64(len(data)), data]
+            for pb in oob:
+                raw = pb.raw()
+                parts.append(_pack_u64(raw.nbytes))
+                parts.append(raw)
+            return b"".join(parts)
+        return b"\x00" + data
+    return b"\x00" + _dumps(value, protocol)
+
+
+def _de_pickle_oob(buf: bytes) -> Any:
+    mv = memoryview(buf)
+    n = _unpack_u64(mv, 1)[0]
+    off = 9
+    stream = mv[off:off + n]
+    off += n
+    buffers = []
+    end = len(buf)
+    while off < end:
+        blen = _unpack_u64(mv, off)[0]
+        off += 8
+        buffers.append(mv[off:off + blen])
+        off += blen
+    return _loads(stream, buffers=buffers)
+
+
+_VALUE_DECODERS = {
+    0x00: lambda b: _loads(memoryview(b)[1:]),
+    0x01: lambda b: int.from_bytes(b[1:9], "little", signed=True),
+    0x02: lambda b: _unpack_double(b, 1)[0],
+    0x03: lambda b: None,
+    0x04: lambda b: True,
+    0x05: lambda b: False,
+    0x06: lambda b: b[1:].decode("utf-8"),
+    0x07: _de_pickle_oob,
+}
 
 
 def _de_value(buf: bytes) -> Any:
-    return pickle.loads(buf)
+    return _VALUE_DECODERS[buf[0]](buf)
 
 
 # -------------------------------------------------------------------
@@ -157,75 +285,183 @@ class ElasticHashTable:
     ----------
     capacity : int
         Initial total slot count across all geometric levels.
+    load_factor : float
+        Fraction of total capacity that may be live before the table
+        doubles.  Lower values trade memory for shorter probe sequences.
+    pickle_protocol : int
+        Pickle protocol for non-scalar values.  Defaults to the highest
+        available; protocol 5 additionally stores large buffers
+        out-of-band.  Pass a lower protocol for wire compatibility with
+        older Pythons.
     """
 
-    __slots__ = ("_handle",)
+    __slots__ = ("_handle", "_scratch", "_pickle_protocol",
+                 "_snap_arrays", "_cap_cache", "_nlevels_cache",
+                 "_finalizer", "__weakref__")
 
-    def __init__(self, capacity: int = 1024) -> None:
-        self._handle = _lib.eht_create(max(capacity, 64))
+    def __init__(self, capacity: int = 1024, load_factor: float = 0.90,
+                 pickle_protocol: int = pickle.HIGHEST_PROTOCOL) -> None:
+        self._handle = _eht_create(max(capacity, 64))
         if not self._handle:
             raise MemoryError("Failed to allocate ElasticHashTable")
-
-    def __del__(self) -> None:
-        if getattr(self, "_handle", None):
-            _lib.eht_destroy(self._handle)
-            self._handle = None
+        if _eht_set_max_load(self._handle, load_factor) < 0:
+            _eht_destroy(self._handle)
+            raise ValueError(f"load_factor must be in (0, 1): {load_factor}")
+        # weakref.finalize frees the C table at a deterministic point even
+        # if the wrapper ends up in a reference cycle, where __del__ would
+        # wait for the cyclic GC.
+        self._finalizer = weakref.finalize(self, _eht_destroy,
+                                           self._handle)
+        self._pickle_protocol = pickle_protocol
+        # Scratch out-params for eht_get, allocated once per thread rather
+        # than per call.  They must be thread-local, not per-table: the
+        # CFUNCTYPE-bound C calls release the GIL, so two threads reading
+        # through shared cells could overwrite each other's ptr/len pair
+        # between the C call and the string_at copy.
+        self._scratch = threading.local()
+        self._snap_arrays = None
+        # Cached eht_capacity / eht_num_levels results.  The layout only
+        # changes on a rebuild, which the C insert/reserve calls signal
+        # with a return code of 1 — until then repr() and load_factor
+        # read these without crossing the FFI.
+        self._cap_cache = None
+        self._nlevels_cache = None
+
+    def close(self) -> None:
+        """Free the C-side table now.  Idempotent; the table must not
+        be used afterwards."""
+        self._finalizer()
 
     # ---- Core operations ---------------------------------------------
 
     def insert(self, key: Any, value: Any) -> None:
         """Insert or update *key* → *value*."""
-        kb = _key_to_bytes(key)
-        vb = _ser_value(value)
-        rc = _lib.eht_insert(self._handle, kb, vb, len(vb))
-        if rc < 0:
-            raise MemoryError("eht_insert failed (allocation error)")
+        self[key] = value
 
     def get(self, key: Any, default: Any = None) -> Any:
         """Return the value for *key*, or *default*."""
         kb = _key_to_bytes(key)
-        val_ptr = ctypes.c_void_p()
-        val_len = ctypes.c_size_t()
-        found = _lib.eht_get(self._handle, kb,
-                              ctypes.byref(val_ptr),
-                              ctypes.byref(val_len))
+        scratch = self._scratch
+        try:
+            val_ptr, val_len, ptr_ref, len_ref = scratch.cells
+        except AttributeError:
+            val_ptr = ctypes.c_void_p()
+            val_len = ctypes.c_size_t()
+            ptr_ref = _byref(val_ptr)
+            len_ref = _byref(val_len)
+            scratch.cells = (val_ptr, val_len, ptr_ref, len_ref)
+        found = _eht_get(self._handle, kb, ptr_ref, len_ref)
         if not found:
             return default
-        buf = (ctypes.c_char * val_len.value).from_address(val_ptr.value)
-        return _de_value(bytes(buf))
+        return _de_value(_string_at(val_ptr, val_len.value))
 
     def delete(self, key: Any) -> bool:
         """Remove *key*.  Returns True if it was present."""
-        kb = _key_to_bytes(key)
-        return bool(_lib.eht_delete(self._handle, kb))
+        return bool(_eht_delete(self._handle, _key_to_bytes(key)))
+
+    def reserve(self, n_entries: int) -> None:
+        """Pre-size the table for *n_entries* live entries.
+
+        One up-front rebuild instead of a cascade of doublings when the
+        final size is known — inserting N items into a small table
+        otherwise rehashes every time the load threshold is crossed.
+        """
+        if n_entries < 0:
+            # c_size_t would silently wrap negatives to huge values
+            raise ValueError(f"n_entries must be non-negative: {n_entries}")
+        rc = _eht_reserve(self._handle, n_entries)
+        if rc < 0:
+            raise MemoryError("eht_reserve failed (allocation error)")
+        if rc:
+            self._cap_cache = self._nlevels_cache = None
+
+    # ---- Batched operations ------------------------------------------
+
+    def bulk_insert(self, items: Any) -> None:
+        """Insert many ``(key, value)`` pairs with one FFI crossing.
+
+        *items* may be a mapping or an iterable of pairs — a drop-in for
+        ``dict.update``-style hot loops.  Encoding still happens per pair
+        in Python, but the Python↔C boundary is crossed exactly once
+        instead of once per entry.
+        """
+        if hasattr(items, "items"):
+            items = items.items()
+        protocol = self._pickle_protocol
+        pairs = [(_key_to_bytes(k), _ser_value(v, protocol))
+                 for k, v in items]
+        n = len(pairs)
+        if not n:
+            return
+        if _eht_reserve(self._handle, _eht_len(self._handle) + n) > 0:
+            self._cap_cache = self._nlevels_cache = None
+        keys = (ctypes.c_char_p * n)(*[kb for kb, _ in pairs])
+        vals = (ctypes.c_char_p * n)(*[vb for _, vb in pairs])
+        lens = (ctypes.c_size_t * n)(*[len(vb) for _, vb in pairs])
+        rc = _eht_bulk_insert(self._handle, n, keys, vals, lens)
+        if rc < 0:
+            raise MemoryError("eht_bulk_insert failed (allocation error)")
+        if rc:
+            self._cap_cache = self._nlevels_cache = None
+
+    def bulk_get(self, keys: Any, default: Any = None) -> list:
+        """Look up many keys with one FFI crossing.
+
+        Returns a list with one entry per key, *default* for misses.
+        """
+        kbs = [_key_to_bytes(k) for k in keys]
+        n = len(kbs)
+        if not n:
+            return []
+        karr  = (ctypes.c_char_p * n)(*kbs)
+        vptrs = (ctypes.c_void_p * n)()
+        vlens = (ctypes.c_size_t * n)()
+        _eht_bulk_get(self._handle, n, karr, vptrs, vlens)
+        return [_de_value(_string_at(vptrs[i], vlens[i]))
+                if vptrs[i] else default
+                for i in range(n)]
 
     # ---- Dict interface ----------------------------------------------
 
+    # The dunders are the user-facing hot API, so they carry the full
+    # bodies; insert()/__delitem__ delegate rather than the other way
+    # around, saving one Python frame per operation.
+
     def __setitem__(self, key: Any, value: Any) -> None:
-        self.insert(key, value)
+        kb = _key_to_bytes(key)
+        vb = _ser_value(value, self._pickle_protocol)
+        rc = _eht_insert(self._handle, kb, vb, len(vb))
+        if rc:
+            if rc < 0:
+                raise MemoryError("eht_insert failed (allocation error)")
+            self._cap_cache = self._nlevels_cache = None
 
     def __getitem__(self, key: Any) -> Any:
         kb = _key_to_bytes(key)
-        val_ptr = ctypes.c_void_p()
-        val_len = ctypes.c_size_t()
-        found = _lib.eht_get(self._handle, kb,
-                              ctypes.byref(val_ptr),
-                              ctypes.byref(val_len))
+        scratch = self._scratch
+        try:
+            val_ptr, val_len, ptr_ref, len_ref = scratch.cells
+        except AttributeError:
+            val_ptr = ctypes.c_void_p()
+            val_len = ctypes.c_size_t()
+            ptr_ref = _byref(val_ptr)
+            len_ref = _byref(val_len)
+            scratch.cells = (val_ptr, val_len, ptr_ref, len_ref)
+        found = _eht_get(self._handle, kb, ptr_ref, len_ref)
         if not found:
             raise KeyError(key)
-        buf = (ctypes.c_char * val_len.value).from_address(val_ptr.value)
-        return _de_value(bytes(buf))
+        return _de_value(_string_at(val_ptr, val_len.value))
 
     def __delitem__(self, key: Any) -> None:
-        if not self.delete(key):
+        if not _eht_delete(self._handle, _key_to_bytes(key)):
             raise KeyError(key)
 
     def __contains__(self, key: Any) -> bool:
         kb = _key_to_bytes(key)
-        return bool(_lib.eht_contains(self._handle, kb))
+        return bool(_eht_contains(self._handle, kb))
 
     def __len__(self) -> int:
-        return _lib.eht_len(self._handle)
+        return _eht_len(self._handle)
 
     def __bool__(self) -> bool:
         return len(self) > 0
@@ -237,93 +473,123 @@ class ElasticHashTable:
 
     # ---- Iteration ---------------------------------------------------
 
+    def _iter_raw(self) -> Iterator[Tuple[bytes, int, int]]:
+        """Snapshot the table and yield raw (key, value_ptr, value_len)."""
+        n = _eht_len(self._handle)
+        # The four scratch arrays are pooled on the instance and grown
+        # geometrically, so repeated scans reuse one allocation instead of
+        # building fresh ctypes arrays each time.  Every snapshot refills
+        # them, so concurrent iterations over an unmutated table see the
+        # same entries.
+        snap = self._snap_arrays
+        if snap is None or snap[0] < n:
+            # Doubling the old capacity (not just fitting n) keeps a table
+            # that grows between scans from reallocating on every scan.
+            cap = max(n, 2 * snap[0] if snap else 0, 64)
+            snap = (cap,
+                    (ctypes.c_void_p * cap)(),
+                    (ctypes.c_size_t * cap)(),
+                    (ctypes.c_void_p * cap)(),
+                    (ctypes.c_size_t * cap)())
+            self._snap_arrays = snap
+        _, k_arr, kl_arr, v_arr, l_arr = snap
+        n = _eht_snapshot(self._handle, k_arr, kl_arr, v_arr, l_arr, n)
+        for i in range(n):
+            yield _string_at(k_arr[i], kl_arr[i]), v_arr[i], l_arr[i]
+
     def keys(self) -> Iterator[str]:
         """Iterate over all keys (as strings)."""
-        it = _lib.eht_iter_create(self._handle)
-        if not it:
-            raise MemoryError("Failed to create iterator")
-        try:
-            k_ptr = ctypes.c_char_p()
-            v_ptr = ctypes.c_void_p()
-            v_len = ctypes.c_size_t()
-            while _lib.eht_iter_next(it,
-                                      ctypes.byref(k_ptr),
-                                      ctypes.byref(v_ptr),
-                                      ctypes.byref(v_len)):
-                yield k_ptr.value.decode("utf-8")
-        finally:
-            _lib.eht_iter_destroy(it)
+        return (k.decode("utf-8") for k, _, _ in self._iter_raw())
 
     def values(self) -> Iterator[Any]:
         """Iterate over all values."""
-        it = _lib.eht_iter_create(self._handle)
-        if not it:
-            raise MemoryError("Failed to create iterator")
-        try:
-            k_ptr = ctypes.c_char_p()
-            v_ptr = ctypes.c_void_p()
-            v_len = ctypes.c_size_t()
-            while _lib.eht_iter_next(it,
-                                      ctypes.byref(k_ptr),
-                                      ctypes.byref(v_ptr),
-                                      ctypes.byref(v_len)):
-                buf = (ctypes.c_char * v_len.value).from_address(v_ptr.value)
-                yield _de_value(bytes(buf))
-        finally:
-            _lib.eht_iter_destroy(it)
+        return (_de_value(_string_at(v, l)) for _, v, l in self._iter_raw())
 
     def items(self) -> Iterator[Tuple[str, Any]]:
         """Iterate over all (key, value) pairs."""
-        it = _lib.eht_iter_create(self._handle)
-        if not it:
-            raise MemoryError("Failed to create iterator")
-        try:
-            k_ptr = ctypes.c_char_p()
-            v_ptr = ctypes.c_void_p()
-            v_len = ctypes.c_size_t()
-            while _lib.eht_iter_next(it,
-                                      ctypes.byref(k_ptr),
-                                      ctypes.byref(v_ptr),
-                                      ctypes.byref(v_len)):
-                key = k_ptr.value.decode("utf-8")
-                buf = (ctypes.c_char * v_len.value).from_address(v_ptr.value)
-                yield key, _de_value(bytes(buf))
-        finally:
-            _lib.eht_iter_destroy(it)
+        return ((k.decode("utf-8"), _de_value(_string_at(v, l)))
+                for k, v, l in self._iter_raw())
 
     def __iter__(self) -> Iterator[str]:
         return self.keys()
 
+    # ---- Raw C access ------------------------------------------------
+
+    @property
+    def raw_handle(self) -> int:
+        """The underlying ``ElasticHashTable*`` as an integer address."""
+        return self._handle
+
+    @property
+    def raw_get_funcptr(self) -> int:
+        """Address of the C ``eht_get`` function as an integer.
+
+        Together with :attr:`raw_handle` this lets JIT compilers drive
+        lookups without the ctypes layer.  numba, for example, accepts a
+        ``ctypes.CFUNCTYPE`` built from this address inside an
+        ``@njit(parallel=True)`` loop and calls it GIL-free::
+
+            get = ctypes.CFUNCTYPE(
+                ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p,
+                ctypes.POINTER(ctypes.c_void_p),
+                ctypes.POINTER(ctypes.c_size_t))(t.raw_get_funcptr)
+
+        The C library takes no locks: concurrent reads are safe only
+        while no thread is inserting or deleting.
+        """
+        return ctypes.cast(_eht_get, ctypes.c_void_p).value
+
     # ---- Metadata / diagnostics --------------------------------------
 
     @property
     def capacity(self) -> int:
-        return _lib.eht_capacity(self._handle)
+        cap = self._cap_cache
+        if cap is None:
+            cap = self._cap_cache = _eht_capacity(self._handle)
+        return cap
 
     @property
     def num_levels(self) -> int:
-        return _lib.eht_num_levels(self._handle)
+        n = self._nlevels_cache
+        if n is None:
+            n = self._nlevels_cache = _eht_num_levels(self._handle)
+        return n
 
     @property
     def load_factor(self) -> float:
         cap = self.capacity
         return len(self) / cap if cap else 0.0
 
+    def level_arrays(self) -> Tuple[Any, Any, Any]:
+        """Return per-level ``(capacities, counts, tombstones)`` arrays.
+
+        One FFI call fills three parallel ``size_t`` arrays.  With numpy
+        installed they come back as zero-copy ``uintp`` arrays, so load
+        factors are a single vectorized divide; otherwise plain lists.
+        """
+        n = _eht_num_levels(self._handle)
+        caps  = (ctypes.c_size_t * n)()
+        cnts  = (ctypes.c_size_t * n)()
+        tombs = (ctypes.c_size_t * n)()
+        _eht_level_arrays(self._handle, caps, cnts, tombs, n)
+        if _np is not None:
+            return (_np.frombuffer(caps, dtype=_np.uintp),
+                    _np.frombuffer(cnts, dtype=_np.uintp),
+                    _np.frombuffer(tombs, dtype=_np.uintp))
+        return list(caps), list(cnts), list(tombs)
+
     def level_stats(self) -> list[dict]:
         """Return per-level diagnostics as a list of dicts."""
-        n = self.num_levels
-        arr = (_EHTLevelInfo * n)()
-        _lib.eht_level_stats(self._handle, arr, n)
+        caps, cnts, tombs = self.level_arrays()
         return [
             {
-                "level":      arr[i].level,
-                "capacity":   arr[i].capacity,
-                "count":      arr[i].count,
-                "tombstones": arr[i].tombstones,
-                "load":       arr[i].count / arr[i].capacity
-                              if arr[i].capacity else 0.0,
+                "level":      i,
+                "capacity":   int(caps[i]),
+                "count":      int(cnts[i]),
+                "tombstones": int(tombs[i]),
+                "load":       cnts[i] / caps[i] if caps[i] else 0.0,
             }
-            for i in range(n)
+            for i in range(len(caps))
         ]
 
     def print_stats(self) -> None:
@@ -334,9 +600,11 @@ class ElasticHashTable:
         print(f"{'=' * 64}")
         print(f"ElasticHashTable  —  {count:,} / {cap:,}  ({load:.1%} load)")
         print(f"{'─' * 64}")
-        for s in self.level_stats():
-            tomb = s["tombstones"]
-            print(f"  Level {s['level']:>2}: {s['capacity']:>8,} slots | "
-                  f"{s['count']:>8,} live ({s['load']:5.1%}) | "
-                  f"{tomb:>5,} tombstones")
+        caps, cnts, tombs = self.level_arrays()
+        for i in range(len(caps)):
+            cap_i, cnt_i = int(caps[i]), int(cnts[i])
+            load_i = cnt_i / cap_i if cap_i else 0.0
+            print(f"  Level {i:>2}: {cap_i:>8,} slots | "
+                  f"{cnt_i:>8,} live ({load_i:5.1%}) | "
+                  f"{int(tombs[i]):>5,} tombstones")
         print(f"{'=' * 64}")
@@ -80,6 +80,30 @@ def test_complex_values():
     print("[PASS] Complex picklable values (dict, list, tuple, set, None)")
 
 
+def test_scalar_fast_path():
+    """Scalars take the tagged raw encoding; edge cases fall back to pickle."""
+    t = ElasticHashTable(256)
+    t["i"]     = -12345
+    t["big"]   = 2 ** 100          # overflows the 8-byte tag → pickle
+    t["f"]     = -0.5
+    t["s"]     = "héllo wörld"
+    t["sur"]   = "bad\ud83dsurrogate"   # not UTF-8 encodable → pickle
+    t["true"]  = True
+    t["false"] = False
+    t["none"]  = None
+
+    assert t["i"]     == -12345
+    assert t["big"]   == 2 ** 100
+    assert t["f"]     == -0.5
+    assert t["s"]     == "héllo wörld"
+    assert t["sur"]   == "bad\ud83dsurrogate"
+    assert t["true"]  is True
+    assert t["false"] is False
+    assert t["none"]  is None
+
+    print("[PASS] Scalar fast-path encoding (int / float / str / bool / None)")
+
+
 def test_deletion_and_tombstones():
     t = ElasticHashTable(512)
     for i in range(200):
@@ -110,6 +134,24 @@ def test_reinsert_after_delete():
     print("[PASS] Re-insert after delete (reclaims tombstone)")
 
 
+def test_bulk_ops():
+    t = ElasticHashTable(512)
+    t.bulk_insert({f"b{i}": i * 3 for i in range(100)})
+    assert len(t) == 100
+    assert t["b42"] == 126
+
+    t.bulk_insert([("extra", "pair")])
+    assert t["extra"] == "pair"
+
+    got = t.bulk_get(["b0", "b99", "missing", "extra"], default=-1)
+    assert got == [0, 297, -1, "pair"]
+
+    t.bulk_insert([])
+    assert t.bulk_get([]) == []
+
+    print("[PASS] Bulk insert / get (single FFI crossing)")
+
+
 def test_iteration():
     t = ElasticHashTable(256)
     expected = {f"key_{i}": i * 10 for i in range(50)}
@@ -138,6 +180,14 @@ def test_bool_repr():
     print("[PASS] __bool__ / __repr__")
 
 
+def test_close():
+    t = ElasticHashTable(128)
+    t["x"] = 1
+    t.close()
+    t.close()   # idempotent
+    print("[PASS] close() frees the C table deterministically")
+
+
 def test_high_load_stress():
     cap = 10_000
     t = ElasticHashTable(cap)
@@ -169,6 +219,7 @@ def test_geometric_distribution(t):
 
 def test_auto_resize():
     t = ElasticHashTable(64)
+    assert t.capacity == 64   # primes the cached value pre-resize
     for i in range(300):
         t[str(i)] = i * 7
     assert len(t) == 300
@@ -178,6 +229,48 @@ def test_auto_resize():
     print(f"[PASS] Auto-resize: 64 → {t.capacity} to hold 300 items")
 
 
+def test_reserve():
+    t = ElasticHashTable(64)
+    t.reserve(300)
+    cap = t.capacity
+    assert cap * 0.9 >= 300
+    for i in range(300):
+        t[str(i)] = i * 7
+    assert t.capacity == cap, "reserve() should have prevented rehashing"
+    assert len(t) == 300
+
+    # A lower load_factor triggers the doubling earlier
+    t2 = ElasticHashTable(256, load_factor=0.5)
+    for i in range(200):
+        t2[f"x{i}"] = i
+    assert t2.capacity > 256
+    assert t2["x199"] == 199
+
+    raised = False
+    try:
+        ElasticHashTable(64, load_factor=1.5)
+    except ValueError:
+        raised = True
+    assert raised
+
+    # Absurd sizes fail cleanly instead of wrapping / spinning in C
+    raised = False
+    try:
+        t.reserve(-1)
+    except ValueError:
+        raised = True
+    assert raised
+
+    raised = False
+    try:
+        t.reserve(2 ** 63)
+    except MemoryError:
+        raised = True
+    assert raised
+
+    print(f"[PASS] reserve() pre-sizing + load_factor tuning")
+
+
 def test_numeric_string_keys():
     """Keys are stringified — verify int keys round-trip via str()."""
     t = ElasticHashTable(256)
@@ -199,6 +292,22 @@ def test_large_values():
     print("[PASS] Large value (10 k element list)")
 
 
+def test_pickle_protocol():
+    """Protocol-5 out-of-band buffers round-trip; older protocols opt down."""
+    import pickle
+
+    t = ElasticHashTable(256)
+    payload = b"\xde\xad" * 4096
+    t["oob"] = pickle.PickleBuffer(payload)   # serialized out-of-band
+    assert bytes(t["oob"]) == payload
+
+    t4 = ElasticHashTable(256, pickle_protocol=4)
+    t4["d"] = {"nested": [1, 2, 3]}
+    assert t4["d"] == {"nested": [1, 2, 3]}
+
+    print("[PASS] Pickle protocol 5 out-of-band buffers + protocol opt-down")
+
+
 def main():
     print("=" * 64)
     print("Elastic Hash Table — Python + C Test Suite")
@@ -208,19 +317,24 @@ def main():
     test_update_existing()
     test_dict_interface()
     test_complex_values()
+    test_scalar_fast_path()
     test_deletion_and_tombstones()
     test_reinsert_after_delete()
+    test_bulk_ops()
     test_iteration()
     test_bool_repr()
+    test_close()
     t = test_high_load_stress()
     test_geometric_distribution(t)
     test_auto_resize()
+    test_reserve()
     test_numeric_string_keys()
     test_large_values()
+    test_pickle_protocol()
 
     print()
     print("=" * 64)
-    print(f"All 13 tests passed.")
+    print(f"All 18 tests passed.")
     print("=" * 64)
 
 